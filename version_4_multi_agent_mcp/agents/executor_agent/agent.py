@@ -9,7 +9,6 @@
 import os
 import logging
 import json
-import anthropic
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -30,15 +29,12 @@ class ExecutorAgent:
         """
         Initialize Claude client and MCP connector - following your pattern
         """
-        # Initialize Claude client (same as your tell_time_agent)
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable is required")
-            
-        self.client = anthropic.Anthropic(api_key=api_key)
+        # Shared async Claude client - one connection pool for every agent in the process
+        from utilities.anthropic_client import get_client
+        self.client = get_client()
         self.model = "claude-sonnet-4-20250514"
         
-        # Initialize MCP connector for Ansible tools
+        # Initialize MCP connector for Ansible tools; tools resolve on first use
         self.mcp_tools = None
         self._initialize_mcp()
         
@@ -48,35 +44,47 @@ class ExecutorAgent:
         """
         Initialize MCP connection - based on your test_mcp_connections.py pattern
         """
+        # Filter to only Ansible tools we'll use for execution
+        self.ansible_tools = [
+            'list_job_templates',    # Find MonteCarlo Application template
+            'get_job_template',      # Get template details
+            'run_job',               # Execute deployment
+            'job_status',            # Monitor progress
+            'job_logs',              # Get logs
+            'list_recent_jobs'       # Check recent runs
+        ]
+
         try:
             from utilities.mcp.mcp_connect import MCPConnector
+            # Discovery starts in the background; construction doesn't wait for it
             self.mcp_connector = MCPConnector()
-            self.mcp_tools = self.mcp_connector.get_tools()
-            
-            # Filter to only Ansible tools we'll use for execution
-            self.ansible_tools = [
-                'list_job_templates',    # Find MonteCarlo Application template
-                'get_job_template',      # Get template details
-                'run_job',               # Execute deployment
-                'job_status',            # Monitor progress
-                'job_logs',              # Get logs
-                'list_recent_jobs'       # Check recent runs
-            ]
-            
-            # Get available tool names
-            available_tools = [tool.name for tool in self.mcp_tools]
-            ansible_tools = [name for name in available_tools if name in self.ansible_tools]
-            logger.info(f"Available Ansible AAP MCP tools: {ansible_tools}")
-            
         except Exception as e:
             logger.error(f"Failed to initialize MCP: {e}")
             self.mcp_tools = []
     
+    async def _ensure_mcp_tools(self) -> list:
+        """
+        Resolve the MCP tools on first use, waiting for discovery without blocking the loop
+        """
+        if self.mcp_tools is None:
+            try:
+                await self.mcp_connector.ready()
+                self.mcp_tools = self.mcp_connector.get_tools()
+
+                # Get available tool names
+                available_tools = [tool.name for tool in self.mcp_tools]
+                ansible_tools = [name for name in available_tools if name in self.ansible_tools]
+                logger.info(f"Available Ansible AAP MCP tools: {ansible_tools}")
+            except Exception as e:
+                logger.error(f"Failed to initialize MCP: {e}")
+                self.mcp_tools = []
+        return self.mcp_tools
+
     async def _call_ansible_tool(self, tool_name: str, args: dict = None) -> dict:
         """
         Call an Ansible AAP MCP tool safely - following your test pattern
         """
-        if not self.mcp_tools:
+        if not await self._ensure_mcp_tools():
             return {"error": "MCP tools not initialized"}
             
         try:
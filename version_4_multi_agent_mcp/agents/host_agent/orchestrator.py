@@ -9,9 +9,7 @@
 import uuid
 import logging
 import asyncio
-import os
 import re
-import anthropic
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -36,6 +34,17 @@ from models.agent import AgentCard
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Readiness indicators in PlannerAgent replies - negatives are checked first
+# so "unhealthy" or "NOT_READY" never count as a positive match
+_NOT_READY_RE = re.compile(
+    r"\b(?:failed|error|unavailable|down|unhealthy|not[ _]ready|cannot proceed)\b",
+    re.IGNORECASE
+)
+_READY_RE = re.compile(
+    r"ready|healthy|accessible|available|running|active|proceed|cleared",
+    re.IGNORECASE
+)
+
 
 class ClaudeOrchestratorAgent:
     """
@@ -54,12 +63,9 @@ class ClaudeOrchestratorAgent:
         """
         Initialize the Claude-based orchestrator with discovered A2A agents and MCP tools.
         """
-        # Initialize Claude client
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable is required")
-
-        self.client = anthropic.Anthropic(api_key=api_key)
+        # Shared async Claude client - awaited so analysis doesn't block the event loop
+        from utilities.anthropic_client import get_client
+        self.client = get_client()
         self.model = "claude-sonnet-4-20250514"
 
         # Build connectors for each A2A agent
@@ -195,6 +201,14 @@ class ClaudeOrchestratorAgent:
         logger.warning(f"Could not extract incident number from response: {response[:100]}...")
         return None
 
+    def _assess_readiness(self, response: str) -> bool:
+        """
+        Decide from a PlannerAgent reply whether deployment should proceed
+        """
+        if _NOT_READY_RE.search(response):
+            return False
+        return bool(_READY_RE.search(response))
+
     async def _handle_servicenow_deployment_workflow(self, query: str, session_id: str) -> str:
         """
         Enhanced Monte Carlo deployment workflow with ServiceNow ITSM integration:
@@ -234,7 +248,7 @@ Failed to create tracking incident: {incident_response}
                 f"Update incident {incident_number} with state 2, work_notes 'Cluster assessment completed. Results: {assessment[:200]}...'", session_id)
 
             # Check if deployment should proceed based on assessment
-            ready_for_deployment = any(keyword in assessment.lower() for keyword in ['ready', 'healthy', 'accessible', 'available'])
+            ready_for_deployment = self._assess_readiness(assessment)
 
             if ready_for_deployment:
                 # Update incident before starting deployment
@@ -437,7 +451,7 @@ Analyze the user request and determine the best approach. For Monte Carlo deploy
             system_prompt = self._build_system_prompt(session_id)
 
             # Call Claude to analyze the request and determine actions
-            analysis_response = self.client.messages.create(
+            analysis_response = await self.client.messages.create(
                 model=self.model,
                 max_tokens=2000,
                 system=system_prompt,
@@ -500,7 +514,7 @@ Analyze the user request and determine the best approach. For Monte Carlo deploy
             assessment = await self._delegate_task("PlannerAgent", query, session_id)
 
             # Step 2: If assessment is positive, proceed with ExecutorAgent
-            if any(keyword in assessment.lower() for keyword in ['ready', 'healthy', 'accessible']):
+            if self._assess_readiness(assessment):
                 logger.info("Step 2: Cluster ready, proceeding with deployment via ExecutorAgent")
                 deployment = await self._delegate_task("ExecutorAgent", query, session_id)
 
@@ -9,7 +9,6 @@
 from server.server import A2AServer
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
 from agents.servicenow_agent.task_manager import ServiceNowTaskManager
-from agents.servicenow_agent.agent import ServiceNowAgent
 import click
 import logging
 
@@ -51,6 +50,9 @@ def main(host, port):
         skills=[skill]
     )
 
+    # Imported here so --help doesn't pay for the anthropic/MCP import chain
+    from agents.servicenow_agent.agent import ServiceNowAgent
+
     # Create the ServiceNow agent
     servicenow_agent = ServiceNowAgent()
 
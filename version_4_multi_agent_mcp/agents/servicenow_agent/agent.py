@@ -10,13 +10,150 @@ import os
 import logging
 import json
 import re
-import anthropic
+import asyncio
+import importlib.util
+from functools import lru_cache
 from dotenv import load_dotenv
+from agents.servicenow_agent.batcher import ServiceNowBatcher
+
+# orjson is optional - fall back to the stdlib parser when it isn't installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # Load environment variables
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# aiosnow is optional - when installed, creates and updates go straight to the REST API
+AIOSNOW_AVAILABLE = importlib.util.find_spec("aiosnow") is not None
+
+# Orchestrator command patterns, compiled once at import
+INCIDENT_NUMBER_RE = re.compile(r"(INC\d+)")
+# Field scanners: one alternation per command so the query is walked once.
+# Group names are the result keys; quoted values are consumed whole, so
+# keywords inside a description can't be mistaken for another field.
+CREATE_FIELDS_RE = re.compile(
+    r"caller\s+(?P<caller_id>[^,]+)"
+    r"|short description\s+'(?P<short_description>[^']+)'"
+    r"|description\s+'(?P<description>[^']+)'"
+    r"|category\s+'?(?P<category>[^,'\s]+)"
+    r"|urgency\s+(?P<urgency>\d+)"
+    r"|impact\s+(?P<impact>\d+)",
+    re.IGNORECASE
+)
+UPDATE_FIELDS_RE = re.compile(
+    r"state\s+(?P<state>\d+)"
+    r"|comments\s+'(?P<comments>[^']+)'"
+    r"|work_notes\s+'(?P<work_notes>[^']+)'",
+    re.IGNORECASE
+)
+# Conversions applied to scanned field values
+FIELD_CONVERTERS = {"caller_id": str.strip, "urgency": int, "impact": int, "state": int}
+OLD_STYLE_WORK_NOTES_RE = re.compile(r"with work notes?:?\s*(.+)", re.IGNORECASE)
+STATE_TEXT_RE = re.compile(r"state to\s+([^,]+)", re.IGNORECASE)
+CLOSE_COMMENTS_RE = re.compile(r"with comments?:?\s*(.+)", re.IGNORECASE)
+
+# Text states accepted by old-style update commands, mapped to ServiceNow state numbers
+STATE_MAP = {
+    "new": 1,
+    "in progress": 2,
+    "work in progress": 2,
+    "on hold": 3,
+    "resolved": 6,
+    "closed": 7
+}
+
+# Incident fields the orchestrator may set on create, with their defaults
+CREATE_DEFAULTS = {
+    "short_description": "Monte Carlo Deployment",
+    "description": "Automated deployment via A2A system",
+    "category": "Software",
+    "urgency": 2,
+    "impact": 2,
+    "caller_id": "A2A System"
+}
+CREATE_ALLOWED_KEYS = frozenset(CREATE_DEFAULTS)
+
+# Incident fields the orchestrator may change on update/close
+UPDATE_FIELDS = ("state", "comments", "work_notes")
+
+# ServiceNow tools we'll use for ITSM
+SERVICENOW_TOOLS = frozenset([
+    'create_incident',           # Create new incidents
+    'update_incident',           # Update existing incidents
+    'search_records',            # Search for records
+    'get_record',                # Get specific record
+    'perform_query',             # Perform queries
+    'add_comment',               # Add customer comments
+    'add_work_notes',            # Add internal work notes
+    'natural_language_search',   # NL search capability
+    'natural_language_update',   # NL update capability
+    'update_script'              # Update scripts if needed
+])
+
+# Substrings that mark a general request as incident-related
+INCIDENT_KEYWORDS = frozenset(['incident', 'ticket', 'create', 'update', 'close', 'track', 'deployment', 'monte carlo'])
+
+# Substrings that turn an incident request into a search
+SEARCH_KEYWORDS = frozenset(['search', 'find'])
+
+# Help replies for general requests that aren't orchestrator commands
+INCIDENT_HELP = """🎫 **ServiceNow ITSM Agent Ready**
+
+I can help with incident management operations:
+
+**Available Commands:**
+- `Create incident for Monte Carlo deployment to [namespace]`
+- `Update incident INC0010001 with [status/details]`
+- `Close incident INC0010001 with [success/failed] status`
+- `Search for incidents about [criteria]`
+
+**Orchestrator Integration:**
+I automatically handle structured commands from the orchestrator for seamless ITSM workflows.
+
+How can I help with your ServiceNow operations?"""
+
+GENERAL_HELP = """🎫 **ServiceNow ITSM Specialist**
+
+I manage ServiceNow incidents and ITSM workflows for Monte Carlo deployments.
+
+**Common Operations:**
+- **Create:** `Create deployment incident for monte-carlo-staging`
+- **Update:** `Update incident INC0010001 with deployment progress`
+- **Close:** `Close incident INC0010002 with success`
+- **Search:** `Search for Monte Carlo incidents`
+
+**Integration:** I work with the orchestrator to provide full ITSM compliance and audit trails for all deployments.
+
+What ServiceNow operation can I help you with?"""
+
+# Help reply for a general request, keyed by whether it mentions incidents
+HELP_REPLIES = {True: INCIDENT_HELP, False: GENERAL_HELP}
+
+# Progress chunk streamed before an orchestrator command's MCP round-trip
+STREAM_STATUS = {
+    "create": "⏳ Creating ServiceNow incident...\n\n",
+    "update": "⏳ Updating ServiceNow incident...\n\n",
+    "close": "⏳ Closing ServiceNow incident...\n\n"
+}
+
+# Words dropped from search queries before they're sent to ServiceNow
+SKIP_WORDS = frozenset(['search', 'find', 'for', 'incidents', 'about', 'show', 'me', 'all', 'get', 'list'])
+
+
+def _scan_fields(pattern: re.Pattern, query: str, result: dict) -> dict:
+    """Fill result from a single finditer pass; the first occurrence of a field wins"""
+    for match in pattern.finditer(query):
+        key = match.lastgroup
+        if key not in result:
+            value = match.group(key)
+            converter = FIELD_CONVERTERS.get(key)
+            result[key] = converter(value) if converter else value
+    return result
+
 
 class ServiceNowAgent:
     """
@@ -26,68 +163,117 @@ class ServiceNowAgent:
     """
 
     # Keep the same supported content types as your pattern
-    SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
+    SUPPORTED_CONTENT_TYPES = ("text", "text/plain")
 
     def __init__(self):
         """
         Initialize Claude client and MCP connector - following your pattern
         """
-        # Initialize Claude client (same as your other agents)
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable is required")
-
-        self.client = anthropic.Anthropic(api_key=api_key)
+        # Shared async Claude client - one connection pool for every agent in the process
+        from utilities.anthropic_client import get_client
+        self.client = get_client()
         self.model = "claude-sonnet-4-20250514"
 
         # Initialize MCP connector for ServiceNow tools
         self.mcp_tools = None
+        self._tools_by_name = {}
         self._initialize_mcp()
 
+        # Direct REST client, created on first use when aiosnow and credentials are available
+        self.snow = None
+        self._snow_auth = (os.getenv("SERVICENOW_USERNAME"), os.getenv("SERVICENOW_PASSWORD"))
+        self._snow_instance = (
+            os.getenv("SERVICENOW_INSTANCE_URL") if AIOSNOW_AVAILABLE and all(self._snow_auth) else None
+        )
+
+        # Coalesces bursts of updates to the same incident into one MCP call
+        self.batcher = ServiceNowBatcher(self._flush_incident_update)
+
         logger.info(f"ServiceNowAgent initialized with Claude Sonnet 4 + ServiceNow MCP")
 
     def _initialize_mcp(self):
         """
         Initialize MCP connection - based on your existing pattern
         """
+        # Filter to only ServiceNow tools we'll use for ITSM
+        self._allowed_snow_tools = SERVICENOW_TOOLS
         try:
-            from utilities.mcp.mcp_connect import MCPConnector
-            self.mcp_connector = MCPConnector()
-            self.mcp_tools = self.mcp_connector.get_tools()
-
-            # Filter to only ServiceNow tools we'll use for ITSM
-            self.servicenow_tools = [
-                'create_incident',           # Create new incidents
-                'update_incident',           # Update existing incidents
-                'search_records',            # Search for records
-                'get_record',                # Get specific record
-                'perform_query',             # Perform queries
-                'add_comment',               # Add customer comments
-                'add_work_notes',            # Add internal work notes
-                'natural_language_search',   # NL search capability
-                'natural_language_update',   # NL update capability
-                'update_script'              # Update scripts if needed
-            ]
-
-            # Get available tool names
-            available_tools = [tool.name for tool in self.mcp_tools]
-            snow_tools = [name for name in available_tools if name in self.servicenow_tools]
-            logger.info(f"Available ServiceNow MCP tools: {snow_tools}")
-
+            from utilities.mcp.mcp_connect import get_shared_connector
+            # Discovery runs once per process in the background; later agents reuse the same tools
+            self.mcp_connector = get_shared_connector()
         except Exception as e:
             logger.error(f"Failed to initialize MCP: {e}")
             self.mcp_tools = []
 
+    async def _ensure_mcp_tools(self) -> list:
+        """
+        Resolve the MCP tools on first use, waiting for discovery without blocking the loop
+        """
+        if self.mcp_tools is None:
+            try:
+                await self.mcp_connector.ready()
+                tools = self.mcp_connector.get_tools()
+                # Index tools by name so each call is a dict lookup, not a list scan
+                self._tools_by_name = {tool.name: tool for tool in tools}
+                self.mcp_tools = tools
+
+                snow_tools = [name for name in self._tools_by_name if name in self._allowed_snow_tools]
+                logger.info(f"Available ServiceNow MCP tools: {snow_tools}")
+            except Exception as e:
+                logger.error(f"Failed to initialize MCP: {e}")
+                self.mcp_tools = []
+        return self.mcp_tools
+
+    def _get_snow(self):
+        """
+        Return the aiosnow client, or None to use MCP - built lazily so it binds to the serving loop
+        """
+        if self.snow is None and self._snow_instance:
+            try:
+                import aiosnow
+                self.snow = aiosnow.Client(self._snow_instance.rstrip('/'), basic_auth=self._snow_auth)
+                logger.info("Using direct ServiceNow REST for incident create/update")
+            except Exception as e:
+                logger.warning(f"aiosnow client unavailable, using MCP: {e}")
+                self._snow_instance = None
+        return self.snow
+
+    @staticmethod
+    def _never_reached_servicenow(error: Exception) -> bool:
+        """
+        True if a REST call failed before connecting, so retrying via MCP can't duplicate it
+        """
+        import aiohttp
+        return isinstance(error, aiohttp.ClientConnectorError)
+
+    async def _rest_create_incident(self, incident_data: dict) -> dict:
+        """
+        Create an incident over the ServiceNow REST API - skips the MCP server hop
+        """
+        from aiosnow.models.table.declared import IncidentModel
+        async with IncidentModel(self.snow, table_name="incident") as incident:
+            response = await incident.create(incident_data)
+        return response.data
+
+    async def _rest_update_incident(self, incident_number: str, updates: dict) -> dict:
+        """
+        Update an incident over the ServiceNow REST API - skips the MCP server hop
+        """
+        from aiosnow.models.table.declared import IncidentModel
+        async with IncidentModel(self.snow, table_name="incident") as incident:
+            response = await incident.update(IncidentModel.number == incident_number, updates)
+        return response.data
+
     async def _call_servicenow_tool(self, tool_name: str, args: dict = None) -> dict:
         """
         Call a ServiceNow MCP tool safely - following your existing pattern
         """
-        if not self.mcp_tools:
+        if not await self._ensure_mcp_tools():
             return {"error": "MCP tools not initialized"}
 
         try:
             # Find the tool
-            tool = next((t for t in self.mcp_tools if t.name == tool_name), None)
+            tool = self._tools_by_name.get(tool_name)
             if not tool:
                 return {"error": f"Tool {tool_name} not found"}
 
@@ -108,15 +294,16 @@ class ServiceNowAgent:
         """
         try:
             # Extract incident number
-            incident_match = re.search(r'(INC\d+)', query.upper())
+            incident_match = INCIDENT_NUMBER_RE.search(query.upper())
             incident_number = incident_match.group(1) if incident_match else None
             
             # Determine command type
-            if query.lower().startswith('create incident'):
+            query_lower = query.lower()
+            if query_lower.startswith('create incident'):
                 return self._parse_create_command(query)
-            elif query.lower().startswith('update incident') and incident_number:
+            elif query_lower.startswith('update incident') and incident_number:
                 return self._parse_update_command(query, incident_number)
-            elif query.lower().startswith('close incident') and incident_number:
+            elif query_lower.startswith('close incident') and incident_number:
                 return self._parse_close_command(query, incident_number)
             else:
                 return {"type": "unknown", "query": query}
@@ -130,39 +317,8 @@ class ServiceNowAgent:
         Parse create incident commands from orchestrator
         Example: "Create incident with caller Roger Lopez, short description 'Deploy Monte Carlo...'"
         """
-        result = {"type": "create"}
-        
-        # Extract caller
-        caller_match = re.search(r"caller\s+([^,]+)", query, re.IGNORECASE)
-        if caller_match:
-            result["caller_id"] = caller_match.group(1).strip()
-        
-        # Extract short description
-        desc_match = re.search(r"short description\s+'([^']+)'", query, re.IGNORECASE)
-        if desc_match:
-            result["short_description"] = desc_match.group(1)
-        
-        # Extract description
-        full_desc_match = re.search(r"description\s+'([^']+)'", query, re.IGNORECASE)
-        if full_desc_match:
-            result["description"] = full_desc_match.group(1)
-        
-        # Extract category
-        category_match = re.search(r"category\s+'?([^,'\s]+)", query, re.IGNORECASE)
-        if category_match:
-            result["category"] = category_match.group(1)
-        
-        # Extract urgency
-        urgency_match = re.search(r"urgency\s+(\d+)", query, re.IGNORECASE)
-        if urgency_match:
-            result["urgency"] = int(urgency_match.group(1))
-        
-        # Extract impact
-        impact_match = re.search(r"impact\s+(\d+)", query, re.IGNORECASE)
-        if impact_match:
-            result["impact"] = int(impact_match.group(1))
-        
-        return result
+        # Extract caller, descriptions, category, urgency and impact in one pass
+        return _scan_fields(CREATE_FIELDS_RE, query, {"type": "create"})
 
     def _parse_update_command(self, query: str, incident_number: str) -> dict:
         """
@@ -171,41 +327,21 @@ class ServiceNowAgent:
         """
         result = {"type": "update", "incident_number": incident_number}
         
-        # Extract state
-        state_match = re.search(r"state\s+(\d+)", query, re.IGNORECASE)
-        if state_match:
-            result["state"] = int(state_match.group(1))
-        
-        # Extract comments
-        comments_match = re.search(r"comments\s+'([^']+)'", query, re.IGNORECASE)
-        if comments_match:
-            result["comments"] = comments_match.group(1)
-        
-        # Extract work notes
-        work_notes_match = re.search(r"work_notes\s+'([^']+)'", query, re.IGNORECASE)
-        if work_notes_match:
-            result["work_notes"] = work_notes_match.group(1)
+        # Extract state, comments and work notes in one pass
+        _scan_fields(UPDATE_FIELDS_RE, query, result)
         
         # Fallback: if no structured fields, extract work notes from common patterns
-        if not any(key in result for key in ["state", "comments", "work_notes"]):
+        if not any(key in result for key in UPDATE_FIELDS):
             # Try old-style commands like "Update incident INC123 state to Work in Progress with work notes: Details"
-            old_style_match = re.search(r"with work notes?:?\s*(.+)", query, re.IGNORECASE)
+            old_style_match = OLD_STYLE_WORK_NOTES_RE.search(query)
             if old_style_match:
                 result["work_notes"] = old_style_match.group(1)
             elif "state to" in query.lower():
-                state_text_match = re.search(r"state to\s+([^,]+)", query, re.IGNORECASE)
+                state_text_match = STATE_TEXT_RE.search(query)
                 if state_text_match:
                     state_text = state_text_match.group(1).strip()
                     # Convert text states to numbers
-                    state_map = {
-                        "new": 1,
-                        "in progress": 2,
-                        "work in progress": 2,
-                        "on hold": 3,
-                        "resolved": 6,
-                        "closed": 7
-                    }
-                    result["state"] = state_map.get(state_text.lower(), 2)
+                    result["state"] = STATE_MAP.get(state_text.lower(), 2)
         
         return result
 
@@ -217,14 +353,15 @@ class ServiceNowAgent:
         result = {"type": "close", "incident_number": incident_number, "state": 6}  # Default to resolved
         
         # Extract resolution comments
-        comments_match = re.search(r"with comments?:?\s*(.+)", query, re.IGNORECASE)
+        comments_match = CLOSE_COMMENTS_RE.search(query)
         if comments_match:
             result["comments"] = comments_match.group(1)
         
         # Check for specific close types
-        if "resolved" in query.lower():
+        query_lower = query.lower()
+        if "resolved" in query_lower:
             result["state"] = 6
-        elif "closed" in query.lower():
+        elif "closed" in query_lower:
             result["state"] = 7
         
         return result
@@ -235,45 +372,37 @@ class ServiceNowAgent:
         """
         try:
             # Prepare incident data with defaults
-            incident_data = {
-                "short_description": create_data.get("short_description", "Monte Carlo Deployment"),
-                "description": create_data.get("description", "Automated deployment via A2A system"),
-                "category": create_data.get("category", "Software").lower(),
-                "urgency": create_data.get("urgency", 2),
-                "impact": create_data.get("impact", 2),
-                "caller_id": create_data.get("caller_id", "A2A System")
-            }
+            incident_data = {**CREATE_DEFAULTS, **{k: v for k, v in create_data.items() if k in CREATE_ALLOWED_KEYS}}
+            incident_data["category"] = incident_data["category"].lower()
+
+            # Fast path: direct REST. Create isn't idempotent, so only fall back
+            # to MCP when the request never reached ServiceNow
+            if self._get_snow():
+                try:
+                    parsed = await self._rest_create_incident(incident_data)
+                    return {"created": True, "incident_number": parsed.get('number'), "incident_data": parsed}
+                except Exception as e:
+                    if not self._never_reached_servicenow(e):
+                        logger.error(f"REST create failed: {e}")
+                        return {"created": False, "error": str(e)}
+                    logger.warning(f"REST create could not connect, retrying via MCP: {e}")
 
             # Create the incident
             create_result = await self._call_servicenow_tool('create_incident', {
                 'incident': incident_data
             })
 
-            if create_result.get('success'):
-                incident_response = create_result['data']
-
-                # Handle different response formats
-                if isinstance(incident_response, list) and len(incident_response) > 0:
-                    if hasattr(incident_response[0], 'text'):
-                        incident_data = json.loads(incident_response[0].text)
-                    else:
-                        incident_data = incident_response[0]
-                elif hasattr(incident_response, 'text'):
-                    incident_data = json.loads(incident_response.text)
-                elif isinstance(incident_response, str):
-                    incident_data = json.loads(incident_response)
-                else:
-                    incident_data = incident_response
+            if not create_result.get('success'):
+                return {"created": False, "error": create_result.get('error')}
 
-                incident_number = incident_data.get('result', {}).get('number') or incident_data.get('number')
+            parsed = self._normalize_mcp_response(create_result['data'])
+            incident_number = parsed.get('result', {}).get('number') or parsed.get('number')
 
-                return {
-                    "created": True,
-                    "incident_number": incident_number,
-                    "incident_data": incident_data
-                }
-            else:
-                return {"created": False, "error": create_result.get('error')}
+            return {
+                "created": True,
+                "incident_number": incident_number,
+                "incident_data": parsed
+            }
 
         except Exception as e:
             logger.error(f"Error creating deployment incident: {e}")
@@ -281,49 +410,107 @@ class ServiceNowAgent:
             logger.error(f"Full traceback: {traceback.format_exc()}")
             return {"created": False, "error": str(e)}
 
+    @staticmethod
+    def _normalize_mcp_response(response) -> dict:
+        """
+        Turn an MCP tool result (text content, content list or JSON string) into a dict
+        """
+        try:
+            return json_loads(
+                response.text if hasattr(response, 'text')
+                else response if isinstance(response, str)
+                else response[0].text
+            )
+        except (AttributeError, IndexError, KeyError, TypeError):
+            # Already-parsed payloads: a dict, or a list holding one
+            if isinstance(response, list) and response:
+                return response[0]
+            return response
+
     async def _update_incident_structured(self, update_data: dict) -> dict:
         """
         Update incident with structured data from orchestrator
         """
         try:
             incident_number = update_data["incident_number"]
-            updates = {}
             
             # Build update object
-            if "state" in update_data:
-                updates["state"] = update_data["state"]
-            if "comments" in update_data:
-                updates["comments"] = update_data["comments"]
-            if "work_notes" in update_data:
-                updates["work_notes"] = update_data["work_notes"]
+            updates = {k: update_data[k] for k in UPDATE_FIELDS if k in update_data}
             
             if not updates:
                 return {"updated": False, "error": "No update fields provided"}
             
-            # Call update_incident MCP tool
-            update_result = await self._call_servicenow_tool('update_incident', {
-                'number': incident_number,
-                'updates': updates
-            })
-
-            if update_result.get('success'):
-                return {"updated": True, "incident_number": incident_number, "updates": updates}
-            else:
-                return {"updated": False, "error": update_result.get('error')}
+            # Queue for the batcher, which merges updates to the same incident
+            return await self.batcher.process(incident_number, updates)
 
         except Exception as e:
             logger.error(f"Error updating incident: {e}")
             return {"updated": False, "error": str(e)}
 
+    async def _flush_incident_update(self, incident_number: str, updates: dict) -> dict:
+        """
+        Send one merged update to ServiceNow - called by the batcher
+        """
+        # Fast path: direct REST. Journal fields append, so only fall back
+        # to MCP when the request never reached ServiceNow
+        if self._get_snow():
+            try:
+                await self._rest_update_incident(incident_number, updates)
+                return {"updated": True, "incident_number": incident_number, "updates": updates}
+            except Exception as e:
+                if not self._never_reached_servicenow(e):
+                    logger.error(f"REST update failed: {e}")
+                    return {"updated": False, "error": str(e)}
+                logger.warning(f"REST update could not connect, retrying via MCP: {e}")
+
+        # Call update_incident MCP tool
+        update_result = await self._call_servicenow_tool('update_incident', {
+            'number': incident_number,
+            'updates': updates
+        })
+
+        if update_result.get('success'):
+            return {"updated": True, "incident_number": incident_number, "updates": updates}
+        else:
+            return {"updated": False, "error": update_result.get('error')}
+
     async def invoke(self, query: str, session_id: str) -> str:
         """
         Handle user query for ITSM operations with enhanced orchestrator command parsing
         """
+        # Parse the command to understand what the orchestrator wants
+        parsed_command = self._parse_orchestrator_command(query)
+        logger.info(f"Parsed command: {parsed_command}")
+        return await self._dispatch(parsed_command, query)
+
+    async def invoke_batch(self, queries: list[str], session_id: str) -> list[str]:
+        """
+        Handle a burst of orchestrator commands, running independent ones concurrently
+
+        Commands for the same incident keep their order; creates, general requests
+        and commands for different incidents all run in parallel.
+        """
+        parsed_commands = [self._parse_orchestrator_command(query) for query in queries]
+        responses = [None] * len(queries)
+
+        # Group by incident so dependent updates stay sequential
+        groups = {}
+        for index, parsed_command in enumerate(parsed_commands):
+            key = parsed_command.get("incident_number") or index
+            groups.setdefault(key, []).append(index)
+
+        async def run_group(indexes: list[int]):
+            for index in indexes:
+                responses[index] = await self._dispatch(parsed_commands[index], queries[index])
+
+        await asyncio.gather(*(run_group(indexes) for indexes in groups.values()))
+        return responses
+
+    async def _dispatch(self, parsed_command: dict, query: str) -> str:
+        """
+        Route a parsed command to the matching ServiceNow operation
+        """
         try:
-            # Parse the command to understand what the orchestrator wants
-            parsed_command = self._parse_orchestrator_command(query)
-            logger.info(f"Parsed command: {parsed_command}")
-            
             # Handle different command types
             if parsed_command["type"] == "create":
                 # Create incident
@@ -371,49 +558,21 @@ class ServiceNowAgent:
         """
         Handle general ServiceNow requests (non-orchestrator commands)
         """
-        incident_keywords = ['incident', 'ticket', 'create', 'update', 'close', 'track', 'deployment', 'monte carlo']
-        is_incident_request = any(keyword.lower() in query.lower() for keyword in incident_keywords)
+        query_lower = query.lower()
+        is_incident_request = any(keyword in query_lower for keyword in INCIDENT_KEYWORDS)
 
-        if is_incident_request:
-            if any(word in query.lower() for word in ['search', 'find']):
-                # Search for incidents
-                search_criteria = self._extract_search_criteria(query)
-                search_result = await self._search_incidents(search_criteria)
+        if is_incident_request and any(keyword in query_lower for keyword in SEARCH_KEYWORDS):
+            # Search for incidents
+            search_criteria = self._extract_search_criteria(query)
+            search_result = await self._search_incidents(search_criteria)
 
-                if search_result.get('found'):
-                    return f"🔍 Found incidents matching '{search_criteria}':\n\n{self._format_search_results(search_result.get('results'))}"
-                else:
-                    return f"❌ No incidents found for '{search_criteria}': {search_result.get('error', 'No matches')}"
+            if search_result.get('found'):
+                return f"🔍 Found incidents matching '{search_criteria}':\n\n{self._format_search_results(search_result.get('results'))}"
             else:
-                return """🎫 **ServiceNow ITSM Agent Ready**
-
-I can help with incident management operations:
-
-**Available Commands:**
-- `Create incident for Monte Carlo deployment to [namespace]`
-- `Update incident INC0010001 with [status/details]`
-- `Close incident INC0010001 with [success/failed] status`
-- `Search for incidents about [criteria]`
-
-**Orchestrator Integration:**
-I automatically handle structured commands from the orchestrator for seamless ITSM workflows.
-
-How can I help with your ServiceNow operations?"""
-        else:
-            # General ServiceNow help
-            return """🎫 **ServiceNow ITSM Specialist**
-
-I manage ServiceNow incidents and ITSM workflows for Monte Carlo deployments.
+                return f"❌ No incidents found for '{search_criteria}': {search_result.get('error', 'No matches')}"
 
-**Common Operations:**
-- **Create:** `Create deployment incident for monte-carlo-staging`
-- **Update:** `Update incident INC0010001 with deployment progress`
-- **Close:** `Close incident INC0010002 with success`
-- **Search:** `Search for Monte Carlo incidents`
-
-**Integration:** I work with the orchestrator to provide full ITSM compliance and audit trails for all deployments.
-
-What ServiceNow operation can I help you with?"""
+        # Everything else gets the matching help reply
+        return HELP_REPLIES[is_incident_request]
 
     async def _search_incidents(self, search_criteria: str) -> dict:
         """
@@ -435,17 +594,11 @@ What ServiceNow operation can I help you with?"""
             logger.error(f"Error searching incidents: {e}")
             return {"found": False, "error": str(e)}
 
-    def _extract_search_criteria(self, query: str) -> str:
-        """Extract search criteria from search query"""
-        words = query.lower().split()
-        criteria_words = []
-
-        skip_words = {'search', 'find', 'for', 'incidents', 'about', 'show', 'me', 'all', 'get', 'list'}
-        for word in words:
-            if word not in skip_words and len(word) > 2:
-                criteria_words.append(word)
-
-        return ' '.join(criteria_words) if criteria_words else 'Monte Carlo'
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _extract_search_criteria(query: str) -> str:
+        """Extract search criteria from search query - cached, since retries repeat queries"""
+        return ' '.join(word for word in query.lower().split() if len(word) > 2 and word not in SKIP_WORDS) or 'Monte Carlo'
 
     def _format_search_results(self, results) -> str:
         """Format search results for display"""
@@ -458,6 +611,12 @@ What ServiceNow operation can I help you with?"""
             elif isinstance(results, list):
                 formatted = []
                 for idx, result in enumerate(results[:5]):
+                    if hasattr(result, 'text'):
+                        # MCP text content - parse JSON records so they format like dicts
+                        try:
+                            result = json_loads(result.text)
+                        except ValueError:
+                            result = result.text
                     if isinstance(result, dict):
                         number = result.get('number', f'Result {idx+1}')
                         description = result.get('short_description', 'No description')
@@ -474,9 +633,14 @@ What ServiceNow operation can I help you with?"""
 
     async def stream(self, query: str, session_id: str):
         """
-        Simulates streaming response - same interface as other agents
+        Stream a progress chunk as soon as the command is parsed, then the result
         """
-        result = await self.invoke(query, session_id)
+        parsed_command = self._parse_orchestrator_command(query)
+        status = STREAM_STATUS.get(parsed_command["type"])
+        if status:
+            yield {"is_task_complete": False, "content": status}
+        
+        result = await self._dispatch(parsed_command, query)
         yield {
             "is_task_complete": True,
             "content": result
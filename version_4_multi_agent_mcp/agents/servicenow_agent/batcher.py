@@ -0,0 +1,144 @@
+# =============================================================================
+# agents/servicenow_agent/batcher.py - Coalesce ServiceNow Incident Updates
+# =============================================================================
+# 🎯 Purpose:
+# Queue incident updates for a few milliseconds and send one merged
+# update_incident call per incident, so bursts from the orchestrator cost
+# one ServiceNow round-trip instead of one per command
+# =============================================================================
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Journal fields append entries in ServiceNow, so merged values are joined, not overwritten
+JOURNAL_FIELDS = ("comments", "work_notes")
+
+
+class ServiceNowBatcher:
+    """
+    🧺 Async batcher for ServiceNow incident updates
+    Callers await process(); a background run() loop flushes queued updates in batches
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[str, dict], Awaitable[dict]],
+        max_batch_size: int = 32,
+        max_queue_time: float = 0.02
+    ):
+        """
+        Args:
+            flush: Coroutine that applies one merged update: flush(incident_number, updates)
+            max_batch_size: Most updates drained from the queue per batch
+            max_queue_time: Seconds to wait for more updates after the first one arrives
+        """
+        self.flush = flush
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._queue = None
+        self._worker = None
+
+    async def process(self, incident_number: str, updates: dict) -> dict:
+        """
+        Queue an update and wait for the result of the merged call that carries it
+        """
+        # Started on first use so the queue and worker live on the serving loop.
+        # A dead worker is restarted on the same queue, so queued updates aren't lost
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self.run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((incident_number, updates, future))
+        return await future
+
+    async def run(self):
+        """
+        Drain the queue forever, flushing once the batch is full or max_queue_time passes
+        """
+        loop = asyncio.get_running_loop()
+        batch = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.max_queue_time
+
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self.process_batch(batch)
+                batch = []
+        except asyncio.CancelledError:
+            self._fail_pending(batch, None)
+            raise
+        except Exception as e:
+            # Callers get the error; the next process() starts a fresh worker
+            logger.error(f"ServiceNow batcher worker stopped: {e}")
+            self._fail_pending(batch, e)
+
+    def _fail_pending(self, batch: list, error: Exception | None) -> None:
+        """
+        Resolve every in-flight and queued waiter so none waits on a worker that is gone.
+        A None error cancels them
+        """
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        for _, _, future in batch:
+            if future.done():
+                continue
+            if error is None:
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+    async def process_batch(self, batch: list) -> None:
+        """
+        Merge queued updates per incident and send one update per incident concurrently
+        """
+        # A cancelled caller's update is dropped rather than sent anyway
+        batch = [item for item in batch if not item[2].cancelled()]
+        if not batch:
+            return
+
+        merged = {}
+        waiters = {}
+        for incident_number, updates, future in batch:
+            target = merged.setdefault(incident_number, {})
+            for field, value in updates.items():
+                if field in JOURNAL_FIELDS and field in target:
+                    target[field] = f"{target[field]}\n\n{value}"
+                else:
+                    # Later fields win
+                    target[field] = value
+            waiters.setdefault(incident_number, []).append((future, updates))
+
+        if len(batch) > len(merged):
+            logger.info(f"Coalesced {len(batch)} ServiceNow updates into {len(merged)} calls")
+
+        results = await asyncio.gather(
+            *(self.flush(number, updates) for number, updates in merged.items()),
+            return_exceptions=True
+        )
+
+        # Every waiter for an incident shares its success and error, but only
+        # sees its own updates, not fields sent by other callers
+        for number, result in zip(merged, results):
+            for future, updates in waiters[number]:
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                elif isinstance(result, dict) and "updates" in result:
+                    future.set_result({**result, "updates": updates})
+                else:
+                    future.set_result(result)
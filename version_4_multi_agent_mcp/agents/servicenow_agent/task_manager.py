@@ -6,11 +6,16 @@
 # Handles JSON-RPC tasks/send requests for ITSM operations
 # =============================================================================
 
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 from server.task_manager import InMemoryTaskManager
 from models.request import SendTaskRequest, SendTaskResponse
 from models.task import Message, TaskStatus, TaskState, TextPart
-from agents.servicenow_agent.agent import ServiceNowAgent
+
+if TYPE_CHECKING:
+    from agents.servicenow_agent.agent import ServiceNowAgent
 
 logger = logging.getLogger(__name__)
 
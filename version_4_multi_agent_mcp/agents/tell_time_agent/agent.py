@@ -6,10 +6,9 @@
 # Keep the exact same interface as the original TellTimeAgent
 # =============================================================================
 
-import os
 import logging
+import re
 from datetime import datetime
-import anthropic
 from dotenv import load_dotenv
 
 # Load environment variables 
@@ -17,6 +16,18 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Static instructions, kept byte-identical across calls so the prompt-cache key matches.
+# The current time goes in a separate uncached block after this one.
+TIME_AGENT_INSTRUCTIONS = """You are a time-telling agent.
+Reply with the current time in the format YYYY-MM-DD HH:MM:SS.
+Be helpful and friendly in your response."""
+
+# The reply is one line, so decode is capped at 64 tokens
+MAX_TOKENS = 64
+
+# Plain time questions are answered locally without a Claude round-trip
+TIME_QUERY_RE = re.compile(r"\b(time|clock|hour|now)\b", re.IGNORECASE)
+
 class TellTimeAgent:
     """
     🕒 Simple agent that tells the current time using Claude Sonnet 4
@@ -30,16 +41,44 @@ class TellTimeAgent:
         """
         Initialize Claude client instead of Google ADK components
         """
-        # Initialize Claude client
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable is required")
-        
-        self.client = anthropic.Anthropic(api_key=api_key)
+        # Shared async Claude client - needed to stream without blocking the event loop
+        from utilities.anthropic_client import get_client
+        self.client = get_client()
         self.model = "claude-sonnet-4-20250514"
         
         logger.info(f"TellTimeAgent initialized with Claude Sonnet 4")
 
+    def _prepare_request(self, query: str):
+        """
+        Build the Claude request for a query, or answer it locally.
+        
+        Returns:
+            tuple: (params, None) when Claude is needed, (None, reply) otherwise
+        """
+        # Get current time
+        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Common case: the answer is just the formatted time
+        if TIME_QUERY_RE.search(query):
+            return None, f"The current time is: {current_time}"
+        
+        # Cached static instructions first, then the per-request time
+        system_prompt = [
+            {"type": "text", "text": TIME_AGENT_INSTRUCTIONS, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": f"The current time is: {current_time}"}
+        ]
+        
+        params = {
+            "model": self.model,
+            "max_tokens": MAX_TOKENS,
+            "system": system_prompt,
+            "messages": [{
+                "role": "user", 
+                "content": query
+            }]
+        }
+        return params, None
+
     async def invoke(self, query: str, session_id: str) -> str:
         """
         Handle a user query and return a response string.
@@ -54,31 +93,18 @@ class TellTimeAgent:
         """
         
         try:
-            # Get current time
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Create system prompt similar to original instruction
-            system_prompt = f"""You are a time-telling agent. 
-            The current time is: {current_time}
-            Reply with the current time in the format YYYY-MM-DD HH:MM:SS.
-            Be helpful and friendly in your response."""
+            params, reply = self._prepare_request(query)
+            if reply is not None:
+                return reply
             
             # Call Claude API
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=1000,
-                system=system_prompt,
-                messages=[{
-                    "role": "user", 
-                    "content": query
-                }]
-            )
+            response = await self.client.messages.create(**params)
             
             # Extract text from response
             if response.content and len(response.content) > 0:
                 return response.content[0].text
             else:
-                return f"The current time is: {current_time}"
+                return f"The current time is: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
                 
         except Exception as e:
             logger.error(f"TellTimeAgent error: {e}")
@@ -87,15 +113,32 @@ class TellTimeAgent:
 
     async def stream(self, query: str, session_id: str):
         """
-        Simulates a "streaming" agent that returns a single reply.
+        Stream Claude's reply as it is generated.
         Keep same interface as original for compatibility.
         
         Yields:
-            dict: Response payload with completion status and time
+            dict: Text chunks, then a final payload with is_task_complete set
+                holding the full reply
         """
-        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        yield {
-            "is_task_complete": True,
-            "content": f"The current time is: {current_time}"
-        }
+        try:
+            params, reply = self._prepare_request(query)
+            if reply is not None:
+                yield {"is_task_complete": True, "content": reply}
+                return
+            
+            parts = []
+            async with self.client.messages.stream(**params) as stream:
+                async for text in stream.text_stream:
+                    parts.append(text)
+                    yield {"is_task_complete": False, "content": text}
+            
+            # Consumers read the answer from the completing chunk
+            yield {"is_task_complete": True, "content": "".join(parts)}
+            
+        except Exception as e:
+            logger.error(f"TellTimeAgent stream error: {e}")
+            # Fallback to simple time response
+            yield {
+                "is_task_complete": True,
+                "content": f"The current time is: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            }
@@ -24,6 +24,7 @@ from models.agent import AgentCard                      # Describes the agent's
 from models.request import A2ARequest, SendTaskRequest  # Request models for tasks
 from models.json_rpc import JSONRPCResponse, InternalError  # JSON-RPC utilities for structured messaging
 from server import task_manager              # Our actual task handling logic (Gemini agent)
+from utilities.anthropic_client import close_client  # Closes the process-wide Claude client
 
 # 🛠️ General utilities
 import json                                              # Used for printing the request payloads (for debugging)
@@ -78,6 +79,9 @@ class A2AServer:
         # 🔎 Register a route for agent discovery (metadata as JSON)
         self.app.add_route("/.well-known/agent.json", self._get_agent_card, methods=["GET"])
 
+        # 🔌 Close the shared Claude client's pooled connections when the server stops
+        self.app.add_event_handler("shutdown", close_client)
+
     # -----------------------------------------------------------------------------
     # ▶️ start(): Launch the web server using uvicorn
     # -----------------------------------------------------------------------------
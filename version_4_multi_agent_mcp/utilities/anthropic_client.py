@@ -0,0 +1,76 @@
+# =============================================================================
+# utilities/anthropic_client.py
+# =============================================================================
+# 🎯 Purpose:
+#   Provide one process-wide AsyncAnthropic client so every agent in the
+#   process shares a single keep-alive connection pool to the Claude API
+#   instead of each agent paying for its own TLS handshakes.
+# =============================================================================
+
+import os  # For reading ANTHROPIC_API_KEY
+import logging  # For logging client setup
+import importlib.util  # To check whether the optional h2 package is installed
+from functools import lru_cache  # Caches the single shared client
+
+# Create a module-level logger using the file's namespace
+logger = logging.getLogger(__name__)
+
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _build_http_client():
+    """
+    Build the pooled keep-alive httpx client that backs the Anthropic SDK.
+
+    Returns:
+        httpx.AsyncClient: Client holding up to 128 connections, 64 of them kept idle for 5 minutes.
+    """
+    # Imported lazily so importing this module stays cheap
+    import httpx
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE,
+            retries=1,
+            limits=httpx.Limits(
+                max_connections=128,
+                max_keepalive_connections=64,
+                keepalive_expiry=300.0
+            )
+        ),
+        timeout=httpx.Timeout(60.0, connect=5.0)
+    )
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    """
+    Return the shared AsyncAnthropic client, creating it on first use.
+
+    Returns:
+        anthropic.AsyncAnthropic: Client shared by every agent in this process.
+
+    Raises:
+        ValueError: If ANTHROPIC_API_KEY is not set.
+    """
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY environment variable is required")
+
+    # Imported lazily so agents that never call Claude don't pay for it
+    import anthropic
+    logger.info(f"[anthropic_client] Creating shared Claude client (HTTP/2: {HTTP2_AVAILABLE})")
+    return anthropic.AsyncAnthropic(
+        api_key=api_key,
+        max_retries=2,
+        http_client=_build_http_client()
+    )
+
+
+async def close_client():
+    """
+    Close the shared client and its connection pool, if it was ever created.
+    """
+    if get_client.cache_info().currsize:
+        await get_client().close()
+        get_client.cache_clear()
@@ -3,19 +3,70 @@
 # =============================================================================
 # 🎯 Purpose:
 #   Connect to each MCP server defined in mcp_config.json,
-#   open ephemeral sessions to list available tools, and
-#   provide an easy interface to call those tools on demand.
+#   list available tools, and provide an easy interface to call
+#   those tools on demand.
+#   All MCP I/O runs on one background event loop thread, where each
+#   server keeps a single long-lived session shared by its tools, and
+#   tool lists are cached on disk so warm starts skip spawning servers.
 #   FIXED: Now properly handles environment variable expansion from config
 # =============================================================================
 
 import os  # For accessing environment variables and file paths
+import re  # For ${VAR} placeholder expansion in server env config
+import json  # For reading/writing the on-disk tool cache
+import time  # For tool cache expiry
+import shutil  # For locating server binaries (cache key includes their mtime)
+import hashlib  # For hashing tool cache keys
 import asyncio  # For running asynchronous functions and event loop
 import logging  # For logging informational messages and warnings
+import threading  # Runs the shared MCP event loop in a background thread
+import tempfile  # Spools large tool responses out of memory
+import uuid  # Names spooled responses
+import weakref  # Deletes a spool file once its LazyContent is gone
+from collections import OrderedDict  # LRU store for memoized tool results
+from functools import partial  # Binds transport arguments for MCPServerSession
+from contextlib import AsyncExitStack  # Holds a persistent session's contexts open
 from dotenv import load_dotenv  # To load environment variables from a .env file
 
 # Import MCP core classes for stdio communication and session handling
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.shared.exceptions import McpError
+
+# uvloop is optional - when installed, the MCP background loop uses its faster
+# selector and subprocess transports; other loops in the process are untouched
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# fastjsonschema is optional - without it, args go to the server unvalidated
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# orjson is optional - fall back to the stdlib for the tool cache and memo keys.
+# JSON-RPC framing itself is done by the mcp SDK through pydantic-core.
+try:
+    import orjson
+
+    def _json_key(obj) -> bytes:
+        """Canonical JSON for cache keys."""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+
+    json_loads = orjson.loads
+    json_dumps_bytes = orjson.dumps
+except ImportError:
+    def _json_key(obj) -> str:
+        """Canonical JSON for cache keys."""
+        return json.dumps(obj, sort_keys=True, default=str)
+
+    json_loads = json.loads
+
+    def json_dumps_bytes(obj) -> bytes:
+        """Serialize to UTF-8 JSON bytes, like orjson.dumps."""
+        return json.dumps(obj).encode()
 
 # Local utility to read MCP server configuration
 from utilities.mcp.mcp_discovery import MCPDiscovery
@@ -28,6 +79,322 @@ logger = logging.getLogger(__name__)
 # Configure the logger to output INFO-level and above messages
 logging.basicConfig(level=logging.INFO)
 
+# Process-wide connectors used by get_shared_connector(), keyed by config file
+_CONNECTORS: dict = {}
+
+# ${VAR} placeholders in server env values, expanded anywhere in the string
+_ENV_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+# Compiled argument validators, shared by tools with identical schemas
+_VALIDATORS: dict = {}
+
+# Shared event loop for all MCP I/O, started on first use by _get_background_loop()
+_BACKGROUND_LOOP = None
+_BACKGROUND_LOOP_LOCK = threading.Lock()
+
+# How long discovered tool lists stay valid on disk
+DEFAULT_CACHE_TTL_SECONDS = 3600
+
+# Memoized results of tools listed under a server's "cacheTools" config key
+DEFAULT_RESULT_CACHE_TTL = 300.0
+RESULT_CACHE_MAXSIZE = 1024
+
+# Response blocks larger than this are spooled to a temp file (see LazyContent)
+DEFAULT_SPOOL_THRESHOLD_BYTES = 1_048_576
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the process-wide MCP event loop, starting its daemon thread on first use.
+
+    Discovery and every tool call run here, so persistent sessions outlive
+    whichever loop (or no loop) the caller happens to be on.
+    """
+    global _BACKGROUND_LOOP
+    with _BACKGROUND_LOOP_LOCK:
+        if _BACKGROUND_LOOP is None:
+            loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="mcp-connector-loop", daemon=True).start()
+            _BACKGROUND_LOOP = loop
+    return _BACKGROUND_LOOP
+
+
+async def _on_background_loop(coro):
+    """
+    Await a coroutine on the MCP background loop from any event loop.
+    Cancelling the caller cancels the coroutine too.
+    """
+    loop = _get_background_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+def _no_validation(args):
+    """Validator used when a schema can't be compiled (or fastjsonschema is missing)."""
+    return args
+
+
+def _compile_validator(schema: dict):
+    """
+    Return a cached validator for a tool's input schema.
+
+    Malformed or unsupported schemas fall back to no validation, so a bad
+    schema never blocks calls that the server itself would accept.
+    """
+    if fastjsonschema is None or not schema:
+        return _no_validation
+    key = _json_key(schema)
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        try:
+            validator = fastjsonschema.compile(schema)
+        except Exception as e:
+            logger.warning(f"[MCPConnector] Skipping argument validation, schema did not compile: {e}")
+            validator = _no_validation
+        _VALIDATORS[key] = validator
+    return validator
+
+
+def _http_transport(transport: str, url: str, headers: dict):
+    """
+    Return a factory for an HTTP-based MCP transport ("sse" or streamable "http").
+
+    Imported lazily so stdio-only setups never load the HTTP client modules.
+    """
+    if transport == "sse":
+        from mcp.client.sse import sse_client
+        return partial(sse_client, url, headers=headers or None)
+    from mcp.client.streamable_http import streamablehttp_client
+    return partial(streamablehttp_client, url, headers=headers or None)
+
+
+def _tools_cache_path() -> str:
+    """
+    Location of the on-disk tool cache (override with A2A_MCP_CACHE_DIR).
+    """
+    cache_dir = os.getenv("A2A_MCP_CACHE_DIR") or os.path.join(
+        os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "a2a_mcp"
+    )
+    return os.path.join(cache_dir, "tools.json")
+
+
+def _cache_key(name: str, cmd: str, args: list[str], env: dict) -> str:
+    """
+    Hash everything that decides a server's tool list.
+
+    Only env var names are used, never their values, so secrets don't end up
+    in the cache file. The server binary's mtime invalidates the entry when
+    the server is upgraded in place.
+    """
+    binary = shutil.which(cmd)
+    try:
+        mtime = os.path.getmtime(binary) if binary else 0
+    except OSError:
+        mtime = 0
+    payload = json.dumps(
+        {"name": name, "command": cmd, "args": list(args), "env": sorted(env or {}), "mtime": mtime},
+        sort_keys=True
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class MCPServerSession:
+    """
+    🔌 Keeps one long-lived MCP ClientSession open to a server and shares it
+    across every tool call to that server.
+
+    The session is opened on the MCP background loop the first time it is
+    needed and is owned by a single task there, so the stdio/session contexts
+    are entered and exited in the same task. A session bound to a loop that
+    is no longer running is replaced transparently.
+
+    Attributes:
+        name (str): Server name from mcp_config.json.
+        open_transport (Callable): Returns the transport context manager,
+            e.g. stdio_client bound to the server's StdioServerParameters.
+    """
+    def __init__(self, name: str, open_transport):
+        self.name = name
+        self.open_transport = open_transport
+        self._loop = None
+        self._ready = None
+        self._stop = None
+        self._task = None
+
+    async def get(self) -> ClientSession:
+        """
+        Return the open session, starting the server on first use.
+        """
+        loop = asyncio.get_running_loop()
+        ready = self._ready
+        if (
+            ready is None
+            or self._loop is not loop
+            or (ready.done() and (ready.cancelled() or ready.exception() is not None))
+        ):
+            ready = self._start(loop)
+        # Shielded so one cancelled caller doesn't cancel the shared connect
+        return await asyncio.shield(ready)
+
+    def _start(self, loop) -> asyncio.Future:
+        """Spawn the task that owns a new session and return its ready future."""
+        self._loop = loop
+        self._ready = loop.create_future()
+        self._stop = asyncio.Event()
+        self._task = loop.create_task(self._hold(self._ready, self._stop))
+        return self._ready
+
+    async def _hold(self, ready: asyncio.Future, stop: asyncio.Event):
+        """Open the session, publish it, and keep it open until asked to stop."""
+        try:
+            async with AsyncExitStack() as stack:
+                # stdio/SSE yield (read, write); streamable HTTP adds a session-id getter
+                streams = await stack.enter_async_context(self.open_transport())
+                read_stream, write_stream = streams[0], streams[1]
+                sess = await stack.enter_async_context(ClientSession(read_stream, write_stream))
+                await sess.initialize()
+                logger.info(f"[MCPConnector] Opened persistent session to {self.name}")
+                ready.set_result(sess)
+                await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"[MCPConnector] Session to {self.name} closed with error: {e}")
+        finally:
+            if not ready.done():
+                ready.cancel()
+
+    def discard(self, session: ClientSession = None):
+        """
+        Drop the current session so the next call reconnects.
+
+        Args:
+            session: The session that failed. If another caller has already
+                reconnected, it is no longer current and nothing is dropped.
+        """
+        if session is not None:
+            ready = self._ready
+            if (
+                ready is None
+                or not ready.done()
+                or ready.cancelled()
+                or ready.exception() is not None
+                or ready.result() is not session
+            ):
+                return
+        if self._stop is not None:
+            self._stop.set()
+        self._ready = None
+
+    async def aclose(self):
+        """
+        Close the session and stop its server process.
+        """
+        task = self._task
+        self.discard()
+        self._task = None
+        if task is not None and not task.done() and self._loop is asyncio.get_running_loop():
+            await asyncio.gather(task, return_exceptions=True)
+
+
+class MCPToolError(Exception):
+    """
+    Raised when an MCP tool call returns something other than a tool result.
+    """
+
+
+class MissingEnvVarError(Exception):
+    """
+    Raised when a server config references a required ${VAR} that is not set.
+    """
+    def __init__(self, name: str):
+        super().__init__(f"Environment variable {name} is not set")
+        self.name = name
+
+
+class LazyContent:
+    """
+    📦 Stands in for a large MCP content block whose payload was spooled to a
+    temporary file, so cached or long-lived results don't keep whole
+    documents in memory.
+
+    Subclasses keep the original block's interface: LazyTextContent has
+    `.text` and LazyBinaryContent has `.data`, read back on demand, while
+    str() gives a short mcp://spool/<uuid> handle for prompts and logs.
+
+    Attributes:
+        type (str): Original block type ("text", "image", ...).
+        mime_type (str): MIME type of the payload.
+        size (int): Payload size in bytes.
+        uri (str): Synthetic handle for the spooled payload.
+    """
+    __slots__ = ("type", "mime_type", "size", "uri", "_path", "__weakref__")
+
+    def __init__(self, payload: bytes, block_type: str, mime_type: str):
+        self.type = block_type
+        self.mime_type = mime_type
+        self.size = len(payload)
+        self.uri = f"mcp://spool/{uuid.uuid4()}"
+        with tempfile.NamedTemporaryFile(prefix="mcp-spool-", delete=False) as spool:
+            spool.write(payload)
+        self._path = spool.name
+        weakref.finalize(self, os.unlink, self._path)
+
+    def open(self):
+        """Open a new read handle on the payload; each reader gets its own."""
+        return open(self._path, "rb")
+
+    def read(self) -> bytes:
+        """Read the whole payload back into memory."""
+        with self.open() as spool:
+            return spool.read()
+
+    def __str__(self) -> str:
+        return self.uri
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.uri}, {self.type}, {self.size} bytes)"
+
+
+class LazyTextContent(LazyContent):
+    """Spooled text block."""
+    __slots__ = ()
+
+    @property
+    def text(self) -> str:
+        return self.read().decode()
+
+
+class LazyBinaryContent(LazyContent):
+    """Spooled image/audio block; `.data` is the original base64 string."""
+    __slots__ = ()
+
+    @property
+    def data(self) -> str:
+        return self.read().decode()
+
+
+def _spool_block(block, threshold: int):
+    """
+    Replace a text or base64 (image/audio) block with a LazyContent if it is over threshold.
+    """
+    payload = getattr(block, "text", None)
+    mime_type = "text/plain"
+    lazy_type = LazyTextContent
+    if payload is None:
+        payload = getattr(block, "data", None)
+        mime_type = getattr(block, "mimeType", "application/octet-stream")
+        lazy_type = LazyBinaryContent
+    # Characters never outnumber UTF-8 bytes 4:1, so short payloads skip the encode
+    if not isinstance(payload, str) or len(payload) * 4 <= threshold:
+        return block
+    encoded = payload.encode()
+    if len(encoded) <= threshold:
+        return block
+    return lazy_type(encoded, getattr(block, "type", "text"), mime_type)
+
 
 class MCPTool:
     """
@@ -37,51 +404,107 @@ class MCPTool:
         name (str): Identifier for the tool (e.g., "run_command").
         description (str): Human-readable description of the tool.
         input_schema (dict): JSON schema defining the tool's expected arguments.
-        _params (StdioServerParameters): Command/args to start the MCP server.
+        cacheable (bool): Whether results are memoized - only for side-effect-free tools.
+        cache_ttl (float): Seconds a memoized result stays valid.
+        server_name (str): Name of the MCP server exposing this tool.
+        spool_threshold_bytes (int): Content blocks larger than this come back as
+            LazyContent; 0 disables spooling.
+        _server (MCPServerSession): Shared session to the server exposing this tool.
     """
+    # Fixed attribute set - no per-tool __dict__, and faster reads in run()
+    __slots__ = (
+        "name", "description", "input_schema", "cacheable", "cache_ttl", "server_name",
+        "spool_threshold_bytes", "_server", "_validate"
+    )
+
+    # Process-wide LRU of (server, tool, args JSON) -> (timestamp, result)
+    _result_cache: OrderedDict = OrderedDict()
+
     def __init__(
         self,
         name: str,
         description: str,
         input_schema: dict,
-        server_cmd: str,
-        server_args: list[str],
-        server_env: dict = None
+        server: MCPServerSession,
+        cacheable: bool = False,
+        cache_ttl: float = DEFAULT_RESULT_CACHE_TTL,
+        spool_threshold_bytes: int = DEFAULT_SPOOL_THRESHOLD_BYTES
     ):
         # Store the tool's name and description for later reference
         self.name = name
         self.description = description
         # Save the JSON schema to validate the `args` passed to run()
         self.input_schema = input_schema
-        # Prepare stdio connection params so we can spawn the server on each call
-        # FIXED: Now includes environment variables
-        self._params = StdioServerParameters(
-            command=server_cmd,
-            args=server_args,
-            env=server_env if server_env else None
-        )
+        # Compiled on first run() so discovery stays cheap
+        self._validate = None
+        # Session shared with every other tool on the same server
+        self.server_name = server.name
+        self._server = server
+        # Opt-in result memoization
+        self.cacheable = cacheable
+        self.cache_ttl = cache_ttl
+        # Large response blocks are moved out of memory
+        self.spool_threshold_bytes = spool_threshold_bytes
 
-    async def run(self, args: dict) -> str:
+    async def run(self, args: dict) -> list:
         """
-        Invoke the tool by:
-          1. Spawning the MCP server via stdio
-          2. Initializing an MCP ClientSession
-          3. Calling the named tool with provided arguments
-          4. Closing the session automatically on exit
+        Invoke the tool on its server's persistent session, opening the
+        session first if this is the first call to that server.
+
+        Cacheable tools return a memoized result for repeated identical args.
 
         Returns:
-            The `content` from the tool's response, or the raw response if no content.
+            list: The `content` blocks from the tool's response. Blocks over
+            the spool threshold are LazyContent handles rather than text.
+
+        Raises:
+            MCPToolError: If the server's reply has no `content`.
+            ValueError: If args don't match the tool's input schema (checked
+                locally, before any round-trip, when fastjsonschema is installed).
         """
-        # Create a stdio connection to the MCP server (ephemeral session)
-        async with stdio_client(self._params) as (read_stream, write_stream):
-            # Wrap the stdio streams in an MCP ClientSession
-            async with ClientSession(read_stream, write_stream) as sess:
-                # Perform any handshake or setup required by MCP
-                await sess.initialize()
-                # Call the tool on the server with given arguments
-                resp = await sess.call_tool(self.name, args)
-                # Return the `content` attribute if present, else string-ify the response
-                return getattr(resp, "content", str(resp))
+        if self._validate is None:
+            self._validate = _compile_validator(self.input_schema)
+        self._validate(args)
+
+        if self.cacheable:
+            key = (self.server_name, self.name, _json_key(args))
+            cached = MCPTool._result_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+                MCPTool._result_cache.move_to_end(key)
+                return cached[1]
+            result = await self._call(args)
+            MCPTool._result_cache[key] = (time.monotonic(), result)
+            MCPTool._result_cache.move_to_end(key)
+            if len(MCPTool._result_cache) > RESULT_CACHE_MAXSIZE:
+                MCPTool._result_cache.popitem(last=False)
+            return result
+        return await self._call(args)
+
+    async def _call(self, args: dict):
+        """Make the tool call on the MCP background loop."""
+        return await _on_background_loop(self._call_on_loop(args))
+
+    async def _call_on_loop(self, args: dict):
+        """Make the actual tool call over the server's persistent session."""
+        sess = await self._server.get()
+        try:
+            # Call the tool on the server with given arguments
+            resp = await sess.call_tool(self.name, args)
+        except McpError:
+            # The server answered with an error - the session itself is fine
+            raise
+        except Exception:
+            # Transport failure (e.g. the server exited) - reconnect on the next call
+            self._server.discard(sess)
+            raise
+        # CallToolResult always carries `content`; anything else is a protocol problem
+        try:
+            content = resp.content
+        except AttributeError:
+            raise MCPToolError(f"{self.server_name}/{self.name} returned {type(resp).__name__}, not a tool result") from None
+        if self.spool_threshold_bytes and isinstance(content, list):
+            content = [_spool_block(block, self.spool_threshold_bytes) for block in content]
+        return content
 
 
 class MCPConnector:
@@ -90,117 +513,366 @@ class MCPConnector:
     and caches them as MCPTool instances for easy lookup.
     FIXED: Now properly handles environment variable expansion
 
+    Server entries are stdio by default. An entry with a "url" connects over
+    streamable HTTP instead ("transport": "sse" for SSE servers), sending
+    its optional "headers" with ${VAR} placeholders expanded. Variables
+    listed under the entry's optional "requiredEnv" must be set, or just
+    that server is skipped; other unset ones keep their placeholder.
+
+    Discovery starts in the background as soon as the connector is built;
+    get_tools() waits for it, and async callers can `await connector.ready()`.
+
     Usage:
         connector = MCPConnector()
         tools = connector.get_tools()
         result = await tools[0].run({"arg1": "value"})
     """
-    def __init__(self, config_file: str = None):
+    def __init__(
+        self,
+        config_file: str = None,
+        cache_ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS,
+        force_refresh: bool = False
+    ):
         # Initialize MCPDiscovery to load server definitions from JSON
         self.discovery = MCPDiscovery(config_file=config_file)
         # Prepare an empty list to hold MCPTool objects
         self.tools: list[MCPTool] = []
-        # Load tools from all configured MCP servers immediately
-        self._load_all_tools()
-
-    def _expand_environment_variables(self, env_vars: dict) -> dict:
-        """
-        Expand environment variable placeholders like ${AAP_TOKEN}
-        Based on the pattern from your test_mcp_connections.py
-        """
-        expanded_env = {}
-        for key, value in env_vars.items():
-            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                # Extract env var name: ${AAP_TOKEN} -> AAP_TOKEN
-                env_var_name = value[2:-1]
-                expanded_value = os.getenv(env_var_name)
-                if expanded_value:
-                    expanded_env[key] = expanded_value
-                    logger.info(f"[MCPConnector] Expanded {key} from ${env_var_name}")
-                else:
-                    logger.warning(f"[MCPConnector] Environment variable {env_var_name} not found")
-                    expanded_env[key] = value  # Keep original value
-            else:
-                expanded_env[key] = value
-        return expanded_env
+        # One persistent session per server, shared by that server's tools
+        self._sessions: dict[str, MCPServerSession] = {}
+        # On-disk tool list cache: a TTL of 0 disables it, force_refresh skips reads
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.force_refresh = force_refresh
+        self._disk_cache: dict = {}
+        self._disk_cache_dirty = False
+        # Background session warm-ups for non-lazy servers loaded from the disk cache
+        self._warmups: set = set()
+        # (exception class, variable or command) pairs whose hints were already logged
+        self._hinted: set[tuple[type, str]] = set()
+        # Start loading tools from all configured MCP servers in the background
+        self._ready_task = self._load_all_tools()
+
+    def ready_sync(self, timeout: float = None):
+        """
+        Block until discovery has finished.
+        """
+        self._ready_task.result(timeout)
+
+    async def ready(self):
+        """
+        Wait for discovery without blocking the caller's event loop.
+        Cancelling the wait leaves discovery running.
+        """
+        await asyncio.shield(asyncio.wrap_future(self._ready_task))
+
+    async def _warm(self, server: MCPServerSession):
+        """Open a server's session ahead of its first tool call."""
+        try:
+            await server.get()
+        except Exception as e:
+            logger.warning(f"[MCPConnector] Warm-up of {server.name} failed: {e}")
+
+    def _expand_environment_variables(self, env_vars: dict, required: frozenset[str] = frozenset()) -> dict:
+        """
+        Expand environment variable placeholders like ${AAP_TOKEN}, including
+        ones embedded in a longer value such as "Bearer ${AAP_TOKEN}".
+        An unset variable raises MissingEnvVarError if it is in `required`;
+        others are left as the original placeholder.
+        """
+        def _sub(match: re.Match) -> str:
+            env_var_name = match.group(1)
+            expanded_value = os.environ.get(env_var_name)
+            if expanded_value is None:
+                if env_var_name in required:
+                    raise MissingEnvVarError(env_var_name)
+                logger.warning(f"[MCPConnector] Environment variable {env_var_name} not found")
+                return match.group(0)  # Keep original value
+            return expanded_value
+
+        return {
+            key: _ENV_RE.sub(_sub, value) if isinstance(value, str) else value
+            for key, value in env_vars.items()
+        }
+
+    def _log_load_failure(self, name: str, cmd: str, e: BaseException):
+        """
+        Log why a server failed to load, with a troubleshooting hint that is
+        shown once per missing variable or bad command rather than once per server.
+        """
+        # anyio task groups wrap a single failure in an ExceptionGroup
+        while isinstance(e, BaseExceptionGroup) and len(e.exceptions) == 1:
+            e = e.exceptions[0]
+        logger.warning(f"[MCPConnector] Failed to list tools from {name}: {e}")
+
+        hint_key = (type(e), e.name if isinstance(e, MissingEnvVarError) else cmd)
+        if hint_key in self._hinted:
+            return
+        match e:
+            case MissingEnvVarError(name=var):
+                logger.warning(f"[MCPConnector] Make sure {var} is set in your environment")
+                logger.warning(f"[MCPConnector] Check: echo ${var}")
+            case FileNotFoundError():
+                logger.warning(f"[MCPConnector] Check that command exists: {cmd}")
+            case PermissionError():
+                logger.warning(f"[MCPConnector] Check that {cmd} is executable")
+            case _:
+                return
+        self._hinted.add(hint_key)
+
+    async def _load_server(self, name: str, info: dict) -> list[MCPTool]:
+        """
+        List one server's tools. A disk-cache hit builds them without starting
+        the server, which then only launches when one of its tools is first
+        called ("lazy": false connects it right away instead). Otherwise the
+        server is started to list them and the discovery session is kept for
+        later tool calls, unless the config sets "lazy": true, which closes it
+        until first use. Failures are logged here and return an empty list, so
+        one bad server never stops the others from loading.
+        """
+        logger.info(f"[MCPConnector] Fetching tools from MCP server: {name}")
+        
+        # Servers with a "url" talk HTTP; "transport" picks "http" (streamable) or "sse"
+        transport = info.get("transport") or ("http" if info.get("url") else "stdio")
+        # Variables this server cannot start without
+        required = frozenset(info.get("requiredEnv", ()))
+        
+        if transport == "stdio":
+            # Extract the command (e.g., "python script.py") and args
+            cmd = info.get("command")
+            args = info.get("args", [])
+            env_vars = info.get("env", {})
+            
+            if not cmd:
+                logger.warning(f"[MCPConnector] No command specified for {name}")
+                return []
+
+            # FIXED: Handle environment variable expansion
+            expanded_env = {}
+            if env_vars:
+                try:
+                    expanded_env = self._expand_environment_variables(env_vars, required)
+                except MissingEnvVarError as e:
+                    self._log_load_failure(name, cmd, e)
+                    return []
+            
+            # Prepare parameters for stdio_client with environment
+            params = StdioServerParameters(
+                command=cmd,
+                args=args,
+                env=expanded_env if expanded_env else None
+            )
+            open_transport = partial(stdio_client, params)
+        else:
+            # HTTP servers keep one pooled keep-alive connection for the session's lifetime
+            cmd = info.get("url")
+            if not cmd:
+                logger.warning(f"[MCPConnector] No url specified for {transport} server {name}")
+                return []
+            args = [transport]
+            # Headers may carry ${VAR} placeholders, e.g. "Bearer ${AAP_TOKEN}"
+            try:
+                expanded_env = self._expand_environment_variables(info.get("headers", {}), required)
+            except MissingEnvVarError as e:
+                self._log_load_failure(name, cmd, e)
+                return []
+            open_transport = _http_transport(transport, cmd, expanded_env)
+        
+        server = self._sessions.setdefault(name, MCPServerSession(name, open_transport))
+        
+        # Side-effect-free tools whose results may be memoized, e.g. "cacheTools": ["namespaces_list"]
+        cache_tools = frozenset(info.get("cacheTools", []))
+        cache_ttl = info.get("cacheTtl", DEFAULT_RESULT_CACHE_TTL)
+        spool_threshold = info.get("spoolThresholdBytes", DEFAULT_SPOOL_THRESHOLD_BYTES)
+        # Unset: lazy on a disk-cache hit, but a cold start keeps its discovery
+        # session rather than spawning the server a second time on first use
+        lazy = info.get("lazy")
+
+        def make_tool(tool_name: str, description: str, input_schema: dict) -> MCPTool:
+            return MCPTool(
+                name=tool_name,
+                description=description,
+                input_schema=input_schema,
+                server=server,
+                cacheable=tool_name in cache_tools,
+                cache_ttl=cache_ttl,
+                spool_threshold_bytes=spool_threshold
+            )
+        
+        # Warm start: rebuild tools from the disk cache without spawning the server
+        key = _cache_key(name, cmd, args, expanded_env)
+        entry = self._disk_cache.get(key)
+        if entry and not self.force_refresh and entry.get("expires_at", 0) > time.time():
+            logger.info(f"[MCPConnector] Loaded {len(entry['tools'])} cached tools for {name}")
+            if lazy is False:
+                # Connect now so the first call finds the session warm
+                task = asyncio.get_running_loop().create_task(self._warm(server))
+                self._warmups.add(task)
+                task.add_done_callback(self._warmups.discard)
+            return [make_tool(t["name"], t["description"], t["input_schema"]) for t in entry["tools"]]
+        
+        try:
+            # Start the server and open its persistent session (handshake included)
+            sess = await server.get()
+            # Ask the server for its list of tools
+            tool_list = (await sess.list_tools()).tools
+            logger.info(
+                f"[MCPConnector] Loaded {len(tool_list)} tools from {name}"
+            )
+            if tool_list and self.cache_ttl_seconds > 0:
+                self._disk_cache[key] = {
+                    "expires_at": time.time() + self.cache_ttl_seconds,
+                    "tools": [
+                        {"name": t.name, "description": t.description, "input_schema": t.inputSchema}
+                        for t in tool_list
+                    ]
+                }
+                self._disk_cache_dirty = True
+            if lazy:
+                await server.aclose()
+            # For each declared tool, wrap it in MCPTool
+            return [make_tool(t.name, t.description, t.inputSchema) for t in tool_list]
+        except Exception as e:
+            server.discard()
+            # If any error occurs (e.g., server not available), log it with a hint
+            self._log_load_failure(name, cmd, e)
+            return []
 
     def _load_all_tools(self):
         """
-        Internal helper: runs an async routine synchronously to fetch
-        and cache tool definitions from every MCP server.
+        Internal helper: starts an async routine that fetches and caches
+        tool definitions from every MCP server, and returns its future.
+        The routine runs on the MCP background loop, so construction never
+        blocks and also works inside a running event loop (ASGI apps, notebooks).
+        Servers are queried concurrently, so startup takes as long as the
+        slowest server rather than the sum of all of them.
         FIXED: Now handles environment variables properly
         """
+        if self.cache_ttl_seconds > 0:
+            self._read_disk_cache()
+
         # Define the async function that does the work
         async def _fetch():
             # Get the mapping: server name → its config dict
             servers = self.discovery.list_servers()
-            # Iterate through each server entry
-            for name, info in servers.items():
-                # Extract the command (e.g., "python script.py") and args
-                cmd = info.get("command")
-                args = info.get("args", [])
-                env_vars = info.get("env", {})
-                
-                logger.info(f"[MCPConnector] Fetching tools from MCP server: {name}")
-                
-                if not cmd:
-                    logger.warning(f"[MCPConnector] No command specified for {name}")
-                    continue
-
-                # FIXED: Handle environment variable expansion
-                expanded_env = {}
-                if env_vars:
-                    expanded_env = self._expand_environment_variables(env_vars)
-                
-                # Prepare parameters for stdio_client with environment
-                params = StdioServerParameters(
-                    command=cmd,
-                    args=args,
-                    env=expanded_env if expanded_env else None
-                )
-                
-                try:
-                    # Open a stdio connection to the MCP server
-                    async with stdio_client(params) as (r, w):
-                        # Wrap in a client session to talk MCP
-                        async with ClientSession(r, w) as sess:
-                            # Initialize the session (handshake)
-                            await sess.initialize()
-                            # Ask the server for its list of tools
-                            tool_list = (await sess.list_tools()).tools
-                            # For each declared tool, wrap it in MCPTool
-                            for t in tool_list:
-                                self.tools.append(
-                                    MCPTool(
-                                        name=t.name,
-                                        description=t.description,
-                                        input_schema=t.inputSchema,
-                                        server_cmd=cmd,
-                                        server_args=args,
-                                        server_env=expanded_env if expanded_env else None
-                                    )
-                                )
-                            logger.info(
-                                f"[MCPConnector] Loaded {len(tool_list)} tools from {name}"
-                            )
-                except Exception as e:
-                    # If any error occurs (e.g., server not available), log a warning
-                    logger.warning(
-                        f"[MCPConnector] Failed to list tools from {name}: {e}"
-                    )
-                    # Print more details for debugging
-                    if "AAP_TOKEN" in str(e):
-                        logger.warning(f"[MCPConnector] Make sure AAP_TOKEN is set in your environment")
-                        logger.warning(f"[MCPConnector] Check: echo $AAP_TOKEN")
-                    elif "command not found" in str(e) or "No such file" in str(e):
-                        logger.warning(f"[MCPConnector] Check that command exists: {cmd}")
-
-        # Run the async fetch coroutine in a new event loop
-        asyncio.run(_fetch())
+            # Query every server at once; results come back in config order
+            results = await asyncio.gather(
+                *(self._load_server(name, info) for name, info in servers.items()),
+                return_exceptions=True
+            )
+            for name, result in zip(servers, results):
+                if isinstance(result, BaseException):
+                    logger.warning(f"[MCPConnector] Failed to list tools from {name}: {result}")
+                else:
+                    self.tools.extend(result)
+            # Stable order across restarts, so prompts listing tools keep hitting the LLM prompt cache
+            self.tools.sort(key=lambda tool: (tool.server_name, tool.name))
+
+            if self._disk_cache_dirty:
+                # File I/O off the MCP loop so other sessions keep flowing
+                await asyncio.to_thread(self._write_disk_cache)
+
+        # Schedule the async fetch coroutine on the shared background loop
+        return asyncio.run_coroutine_threadsafe(_fetch(), _get_background_loop())
+
+    def _read_disk_cache(self):
+        """
+        Load the on-disk tool cache, dropping expired entries. A missing or
+        unreadable file just means a cold start.
+        """
+        try:
+            with open(_tools_cache_path(), "rb") as f:
+                data = json_loads(f.read())
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            now = time.time()
+            self._disk_cache = {
+                key: entry for key, entry in data.items()
+                if isinstance(entry, dict) and entry.get("expires_at", 0) > now
+            }
+
+    def _write_disk_cache(self):
+        """
+        Write the tool cache atomically so concurrent agents never read a partial file.
+        """
+        path = _tools_cache_path()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(json_dumps_bytes(self._disk_cache))
+            os.replace(tmp_path, path)
+            self._disk_cache_dirty = False
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"[MCPConnector] Could not write tool cache {path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def get_tools(self) -> list[MCPTool]:
         """
-        Return a shallow copy of the list of MCPTool instances.
+        Return a shallow copy of the list of MCPTool instances, sorted by
+        (server name, tool name). Waits for discovery to finish first.
         Ensures external code cannot modify our internal cache.
         """
+        self.ready_sync()
         return self.tools.copy()
+
+    @staticmethod
+    async def run_many(calls: list[tuple[MCPTool, dict]]) -> list:
+        """
+        Run independent tool calls concurrently.
+
+        Calls to the same server are multiplexed on its persistent session, so
+        wall time is the slowest call rather than the sum of all of them.
+        Gathered on the caller's loop like a single run(), so validation and
+        the result memo stay on one thread and only the tool calls hop loops.
+
+        Args:
+            calls: (tool, args) pairs.
+
+        Returns:
+            list: Each call's result, or the exception it raised, in call order.
+        """
+        return await asyncio.gather(
+            *(tool.run(args) for tool, args in calls),
+            return_exceptions=True
+        )
+
+    async def aclose(self):
+        """
+        Close every persistent server session this connector opened.
+        """
+        async def _close_all():
+            await asyncio.gather(*(server.aclose() for server in self._sessions.values()))
+
+        await _on_background_loop(_close_all())
+
+
+def get_shared_connector(config_file: str = None) -> MCPConnector:
+    """
+    Return the process-wide connector for a config file, starting its
+    discovery in the background on first use.
+
+    Every agent constructed after the first reuses the same MCPTool instances
+    instead of re-spawning each MCP server to list its tools. A connector
+    whose discovery failed or found nothing is replaced, so a later agent
+    retries discovery.
+    """
+    connector = _CONNECTORS.get(config_file)
+    if connector is not None and connector._ready_task.done():
+        if connector._ready_task.exception() is not None or not connector.tools:
+            connector = None
+    if connector is None:
+        connector = _CONNECTORS[config_file] = MCPConnector(config_file=config_file)
+    return connector
+
+
+def get_cached_tools(config_file: str = None) -> tuple[MCPTool, ...]:
+    """
+    Discover tools once per config file and share them across the process.
+    Blocks until discovery has finished; async callers should await
+    get_shared_connector(...).ready() instead.
+
+    Returns:
+        tuple[MCPTool, ...]: Immutable snapshot of the discovered tools.
+    """
+    return tuple(get_shared_connector(config_file).get_tools())